@@ -5,6 +5,10 @@ RT-DC event image mask.
 
 import numpy as np
 
+#: gray values and their squares of 8bit images (histogram bins)
+_GRAY_VALUES = np.arange(256, dtype=np.int64)
+_GRAY_VALUES_SQ = _GRAY_VALUES**2
+
 
 def get_bright(mask, image, ret_data="avg,sd"):
     """Compute avg and/or std of the event brightness
@@ -51,18 +55,34 @@ def get_bright(mask, image, ret_data="avg,sd"):
 
     # Results are stored in a separate array initialized with nans
     if ret_avg:
-        avg = np.zeros(length, dtype=float) * np.nan
+        avg = np.full(length, np.nan, dtype=float)
     if ret_std:
-        std = np.zeros(length, dtype=float) * np.nan
+        std = np.full(length, np.nan, dtype=float)
 
     for ii in range(length):
-        imgi = image[ii]
-        mski = mask[ii]
-        # Assign results
+        # Extract the event pixels only once for all metrics
+        pixels = image[ii][mask[ii]]
+        if pixels.dtype == np.uint8 and pixels.size:
+            # For 8bit images, compute the moments from the histogram
+            # of gray values (exact integer sums over only 256 bins).
+            hist = np.bincount(pixels, minlength=256)
+            size = int(pixels.size)
+            sum1 = int(np.dot(hist, _GRAY_VALUES))
+            avg_i = sum1 / size
+            if ret_std:
+                sum2 = int(np.dot(hist, _GRAY_VALUES_SQ))
+                std[ii] = np.sqrt((size * sum2 - sum1**2) / size**2)
+        else:
+            # The average is required for the standard deviation as well,
+            # so compute it only once (`np.std` would compute it again).
+            avg_i = np.mean(pixels)
+            if ret_std:
+                # The dot product reduces the squared deviations in a
+                # single pass without allocating another temporary array.
+                dev = pixels - avg_i
+                std[ii] = np.sqrt(np.dot(dev, dev) / dev.size)
         if ret_avg:
-            avg[ii] = np.mean(imgi[mski])
-        if ret_std:
-            std[ii] = np.std(imgi[mski])
+            avg[ii] = avg_i
 
     results = []
     # Keep alphabetical order
@@ -66,8 +66,10 @@ def get_contour(mask):
                               level=.9999,
                               positive_orientation="low",
                               fully_connected="high")
-        # get the longest contour
-        c0 = sorted(conts, key=lambda x: len(x))[-1]
+        if not conts:
+            raise NoValidContourFoundError("No contour found!")
+        # get the longest contour (the last one if there are several)
+        c0 = max(reversed(conts), key=len)
         # round all coordinates to pixel values
         c1 = np.asarray(np.round(c0), int)
         # remove duplicates
@@ -108,10 +110,9 @@ def get_contour_lazily(mask):
 
 
 def remove_duplicates(cont):
-    out = []
-    for ii in range(len(cont)):
-        if np.all(cont[ii] == cont[ii - 1]):
-            pass
-        else:
-            out.append(cont[ii])
-    return np.array(out)
+    """Remove consecutive duplicate points from a closed contour"""
+    cont = np.asarray(cont)
+    # compare each point to its predecessor (the first point is
+    # compared to the last point, because the contour is closed)
+    keep = np.any(cont != np.roll(cont, 1, axis=0), axis=1)
+    return cont[keep]
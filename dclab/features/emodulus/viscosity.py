@@ -1,5 +1,6 @@
 """Viscosity computation for various media"""
 
+import numbers
 import warnings
 
 import numpy as np
@@ -10,11 +11,58 @@ from ...warn import PipelineWarning
 #: Media for which computation of viscosity is defined
 KNOWN_MEDIA = ["CellCarrier", "CellCarrierB", "water"]
 
+#: Mapping of lower-case medium names (and aliases) to
+#: :const:`KNOWN_MEDIA`; used for case-insensitive lookup
+ALIAS_MEDIA = {"cellcarrier": "CellCarrier",
+               "cellcarrierb": "CellCarrierB",
+               # also support a space before the "B"
+               "cellcarrier b": "CellCarrierB",
+               "water": "water",
+               }
+
+
+# Constant terms of the shear-thinning model for CellCarrier (CC) and
+# CellCarrier B (CCB), see :cite:`Herold2017`
+_TERM2_CC = 0.6771 / 0.5928 + 0.2121 / (0.5928 * 0.677)
+_TERM2_CCB = 0.6771 / 0.5928 + 0.2121 / (0.5928 * 0.634)
+
 
 class TemperatureOutOfRangeWarning(PipelineWarning):
     pass
 
 
+def check_temperature(medium, temperature, tmin, tmax, valid_range=None):
+    """Issue a :class:`TemperatureOutOfRangeWarning` if applicable
+
+    Parameters
+    ----------
+    medium: str
+        Name of the medium (only used in the warning message)
+    temperature: float or ndarray
+        Temperature in °C
+    tmin, tmax: float
+        Temperature interval outside of which a warning is issued
+    valid_range: tuple of float or None
+        Temperature range mentioned in the warning message; defaults
+        to `(tmin, tmax)`
+    """
+    if valid_range is None:
+        valid_range = tmin, tmax
+    if isinstance(temperature, numbers.Number):
+        # avoid creating 0-d arrays for scalar temperatures
+        tlow = thigh = temperature
+    else:
+        tlow = np.min(temperature)
+        thigh = np.max(temperature)
+    if tlow < tmin or thigh > tmax:
+        # CellCarrier: see figure (9) in Herold arXiv:1704.00572 (2017)
+        warnings.warn("For {}, the temperature should be in ".format(medium)
+                      + "[{:g}, {:g}] degC! Got min/max of ".format(
+                          *valid_range)
+                      + "[{:.1f}, {:.1f}] degC.".format(tlow, thigh),
+                      TemperatureOutOfRangeWarning)
+
+
 def get_viscosity(medium="CellCarrier", channel_width=20.0, flow_rate=0.16,
                   temperature=23.0):
     """Returns the viscosity for RT-DC-specific media
@@ -61,50 +109,33 @@ def get_viscosity(medium="CellCarrier", channel_width=20.0, flow_rate=0.16,
       by :cite:`Herold2017` and :cite:`Kestin_1978`.
     """
     # also support lower-case media and a space before the "B"
-    valmed = [v.lower() for v in KNOWN_MEDIA + ["CellCarrier B"]]
-    medium = medium.lower()
-    if medium not in valmed:
-        raise ValueError("Invalid medium: {}".format(medium))
+    canonical = ALIAS_MEDIA.get(medium.lower())
+    if canonical is None:
+        raise ValueError("Invalid medium: {}".format(medium.lower()))
 
     # convert flow_rate from µL/s to m³/s
     # convert channel_width from µm to m
     term1 = 1.1856 * 6 * flow_rate * 1e-9 / (channel_width * 1e-6)**3 * 2 / 3
 
-    if medium == "cellcarrier":
+    if canonical == "CellCarrier":
         temp_corr = (temperature / 23.2)**-0.866
-        term2 = 0.6771 / 0.5928 + 0.2121 / (0.5928 * 0.677)
-        eta = 0.179 * (term1 * term2)**(0.677 - 1) * temp_corr * 1e3
-        if np.min(temperature) < 16 or np.max(temperature) > 26:
-            # see figure (9) in Herold arXiv:1704.00572 (2017)
-            warnings.warn("For CellCarrier, the temperature should be in "
-                          + "[18, 26] degC! Got min/max of "
-                          + "[{:.1f}, {:.1f}] degC.".format(
-                              np.min(temperature), np.max(temperature)),
-                          TemperatureOutOfRangeWarning)
-    elif medium in ["cellcarrierb", "cellcarrier b"]:
+        eta = 0.179 * (term1 * _TERM2_CC)**(0.677 - 1) * temp_corr * 1e3
+        check_temperature("CellCarrier", temperature, 16, 26,
+                          valid_range=(18, 26))
+    elif canonical == "CellCarrierB":
         temp_corr = (temperature / 23.6)**-0.866
-        term2 = 0.6771 / 0.5928 + 0.2121 / (0.5928 * 0.634)
-        eta = 0.360 * (term1 * term2)**(0.634 - 1) * temp_corr * 1e3
-        if np.min(temperature) < 16 or np.max(temperature) > 26:
-            # see figure (9) in Herold arXiv:1704.00572 (2017)
-            warnings.warn("For CellCarrier B, the temperature should be in "
-                          + "[18, 26] degC! Got min/max of "
-                          + "[{:.1f}, {:.1f}] degC.".format(
-                              np.min(temperature), np.max(temperature)),
-                          TemperatureOutOfRangeWarning)
-    elif medium == "water":
-        if np.min(temperature) < 0 or np.max(temperature) > 40:
-            # see equation (15) in Kestin et al, J. Phys. Chem. 7(3) 1978
-            warnings.warn("For water, the temperature should be in [0, 40] "
-                          + "degC! Got min/max of "
-                          + "[{:.1f}, {:.1f}] degC.".format(
-                              np.min(temperature), np.max(temperature)),
-                          TemperatureOutOfRangeWarning)
+        eta = 0.360 * (term1 * _TERM2_CCB)**(0.634 - 1) * temp_corr * 1e3
+        check_temperature("CellCarrier B", temperature, 16, 26,
+                          valid_range=(18, 26))
+    elif canonical == "water":
+        check_temperature("water", temperature, 0, 40)
         eta0 = 1.002  # [mPa]
-        right = (20-temperature) / (temperature + 96) \
+        # see equation (15) in Kestin et al, J. Phys. Chem. 7(3) 1978
+        dt = 20 - temperature
+        right = dt / (temperature + 96) \
             * (+ 1.2364
-               - 1.37e-3 * (20 - temperature)
-               + 5.7e-6 * (20 - temperature)**2
+               - 1.37e-3 * dt
+               + 5.7e-6 * dt**2
                )
         eta = eta0 * 10**right
     return eta
@@ -3,7 +3,7 @@ of the contours"""
 import numpy as np
 
 
-def get_volume(cont, pos_x, pos_y, pix):
+def get_volume(cont, pos_x, pos_y, pix, out=None):
     """Calculate the volume of a polygon revolved around an axis
 
     The volume estimation assumes rotational symmetry.
@@ -26,6 +26,10 @@ def get_volume(cont, pos_x, pos_y, pix):
     px_um: float
         The detector pixel size in µm.
         e.g. obtained using: `mm.config["imaging"]["pixel size"]`
+    out: ndarray of length N or None
+        Optional output array of dtype float (e.g. for reusing memory
+        when computing the volume in batches); requires `pos_x` to
+        be an array.
 
     Returns
     -------
@@ -69,7 +73,25 @@ def get_volume(cont, pos_x, pos_y, pix):
         raise ValueError("Number of given contours too small!")
 
     # results are stored in a separate array initialized with nans
-    v_avg = np.zeros_like(pos_x, dtype=float)*np.nan
+    if out is None:
+        v_avg = np.full(pos_x.shape, np.nan, dtype=float)
+    else:
+        if not ret_list:
+            raise ValueError("`out` is not supported for scalar `pos_x`!")
+        if out.shape != pos_x.shape:
+            raise ValueError("Shape of `out` must match that of `pos_x`!")
+        if not np.issubdtype(out.dtype, np.floating):
+            raise ValueError("`out` must have a floating point dtype!")
+        v_avg = out
+        v_avg[:] = np.nan
+
+    # The constant prefactor of the volume integral (π/3) and the
+    # conversion from px³ to µm³ are applied once per event.
+    scale = np.pi / 3 * pix**3
+
+    # Convert the centroids to pixel units for all events at once
+    pos_x_px = pos_x / pix
+    pos_y_px = pos_y / pix
 
     # v_avg has the shape of `pos_x`. We are iterating over the smallest
     # length for `cont` and `pos_x`.
@@ -79,37 +101,30 @@ def get_volume(cont, pos_x, pos_y, pix):
         cc = cont[ii]
         if cc.shape[0] >= 4:
             # Center contour coordinates with given centroid
-            contour_x = cc[:, 0] - pos_x[ii] / pix
-            contour_y = cc[:, 1] - pos_y[ii] / pix
+            contour_x = cc[:, 0] - pos_x_px[ii]
+            contour_y = cc[:, 1] - pos_y_px[ii]
             # Make sure contour is counter-clockwise
             contour_x, contour_y = counter_clockwise(contour_x, contour_y)
-            # Which points are below the x-axis? (y<0)?
-            ind_low = np.where(contour_y < 0)
-            # These points will be shifted up to y=0 to build an x-axis
-            # (wont contribute to lower volume).
-            contour_y_low = np.copy(contour_y)
-            contour_y_low[ind_low] = 0
-            # Which points are above the x-axis? (y>0)?
-            ind_upp = np.where(contour_y > 0)
-            # These points will be shifted down to y=0 to build an x-axis
-            # (wont contribute to upper volume).
-            contour_y_upp = np.copy(contour_y)
-            contour_y_upp[ind_upp] = 0
+            # Points below the x-axis (y<0) will be shifted up to y=0
+            # to build an x-axis (wont contribute to lower volume).
+            contour_y_low = np.maximum(contour_y, 0)
+            # Points above the x-axis (y>0) will be shifted down to y=0
+            # to build an x-axis (wont contribute to upper volume).
+            contour_y_upp = np.minimum(contour_y, 0)
             # Move the contour to the left
             Z = contour_x
-            # Last point of the contour has to overlap with the first point
-            Z = np.hstack([Z, Z[0]])
-            Zp = Z[0:-1]
-            dZ = Z[1:]-Zp
+            # The contour is closed (the last point connects to the
+            # first point); np.roll wraps around without stacking the
+            # first point to the end of each array.
+            dZ = np.roll(Z, -1) - Z
 
-            # Last point of the contour has to overlap with the first point
-            contour_y_low = np.hstack([contour_y_low, contour_y_low[0]])
-            contour_y_upp = np.hstack([contour_y_upp, contour_y_upp[0]])
+            # Z**2 is required for both halves
+            Z2 = Z**2
 
-            vol_low = _vol_helper(contour_y_low, Z, Zp, dZ, pix)
-            vol_upp = _vol_helper(contour_y_upp, Z, Zp, dZ, pix)
+            vol_low = _vol_helper(contour_y_low, Z, Z2, dZ)
+            vol_upp = _vol_helper(contour_y_upp, Z, Z2, dZ)
 
-            v_avg[ii] = (vol_low + vol_upp) / 2
+            v_avg[ii] = (vol_low + vol_upp) / 2 * scale
 
     if not ret_list:
         # Do not return a list if the input contour was not in a list
@@ -136,24 +151,31 @@ def counter_clockwise(cx, cy):
     angles = np.unwrap(np.arctan2(cy, cx))
     grad = np.gradient(angles)
     if np.average(grad) > 0:
-        return cx[::-1], cy[::-1]
+        # Return contiguous copies (instead of views with negative
+        # strides), which are faster to process in subsequent steps.
+        return np.ascontiguousarray(cx[::-1]), np.ascontiguousarray(cy[::-1])
     else:
         return cx, cy
 
 
-def _vol_helper(contour_y, Z, Zp, dZ, pix):
+def _vol_helper(contour_y, Z, Z2, dZ):
+    """Volume of a closed contour revolved around the x-axis
+
+    The volume is returned in units of (π/3)·pix³.
+    """
     # Instead of x and y, describe the contour by a Radius vector R and y
     # The Contour will be rotated around the x-axis. Therefore it is
     # Important that the Contour has been shifted onto the x-Axis
-    R = np.sqrt(Z**2 + contour_y**2)
-    Rp = R[0:-1]
-    dR = R[1:] - Rp
-    # 4 volume parts
-    v1 = dR * dZ * Rp
-    v2 = 2 * dZ * Rp**2
-    v3 = -1 * dR**2 * dZ
-    v4 = -2 * dR * Rp * Zp
-
-    V = (np.pi/3) * (v1 + v2 + v3 + v4)
-    vol = np.sum(V) * pix**3
-    return abs(vol)
+    Rp = np.sqrt(Z2 + contour_y**2)
+    # (the contour is closed)
+    dR = np.roll(Rp, -1) - Rp
+    # The 4 volume parts
+    #   v1 = dR * dZ * Rp
+    #   v2 = 2 * dZ * Rp**2
+    #   v3 = -1 * dR**2 * dZ
+    #   v4 = -2 * dR * Rp * Z
+    # are combined into two products to avoid allocating a temporary
+    # array for each of them.
+    V = dZ * (Rp * (dR + 2 * Rp) - dR**2)
+    V -= 2 * dR * Rp * Z
+    return abs(np.sum(V))
@@ -191,13 +191,16 @@ class Rlme4(object):
 
             # Concatenate huge arrays for R
             r_features = rpy2.robjects.FloatVector(np.concatenate(features))
-            _groups = []
-            _repets = []
+            # Fill preallocated arrays with groups and repetitions
+            # (avoids one temporary array per dataset)
+            bounds = np.cumsum([0] + [len(ff) for ff in features])
+            _groups = np.empty(bounds[-1], dtype=np.asarray(groups).dtype)
+            _repets = np.empty(bounds[-1], dtype=int)
             for ii in range(len(features)):
-                _groups.append(np.repeat(groups[ii], len(features[ii])))
-                _repets.append(np.repeat(repetitions[ii], len(features[ii])))
-            r_groups = rpy2.robjects.StrVector(np.concatenate(_groups))
-            r_repetitions = rpy2.robjects.IntVector(np.concatenate(_repets))
+                _groups[bounds[ii]:bounds[ii+1]] = groups[ii]
+                _repets[bounds[ii]:bounds[ii+1]] = repetitions[ii]
+            r_groups = rpy2.robjects.StrVector(_groups)
+            r_repetitions = rpy2.robjects.IntVector(_repets)
 
             # Register groups and repetitions
             rpy2.robjects.globalenv["feature"] = r_features
@@ -299,11 +302,13 @@ class Rlme4(object):
         features = []
         groups = []
         repetitions = []
+        # repetitions per group (collected in a single pass)
+        group_reps = {}
+        for dd in self.data:
+            group_reps.setdefault(dd[1], set()).add(dd[2])
         # compute differential features
-        for grp in sorted(set([dd[1] for dd in self.data])):
-            # repetitions per groups
-            grp_rep = sorted(set([dd[2] for dd in self.data if dd[1] == grp]))
-            for rep in grp_rep:
+        for grp in sorted(group_reps):
+            for rep in sorted(group_reps[grp]):
                 feat_cha = self.get_feature_data(grp, rep, region="channel")
                 feat_res = self.get_feature_data(grp, rep, region="reservoir")
                 bs_cha, bs_res = bootstrapped_median_distributions(feat_cha,
@@ -343,7 +348,7 @@ class Rlme4(object):
                              + " '{}', and region".format(repetition)
                              + " '{}' not found!".format(region))
         fdata = ds[self.feature][ds.filter.all]
-        fdata_valid = fdata[~np.logical_or(np.isnan(fdata), np.isinf(fdata))]
+        fdata_valid = fdata[np.isfinite(fdata)]
         return fdata_valid
 
     def is_differential(self):
@@ -407,16 +412,25 @@ def bootstrapped_median_distributions(a, b, bs_iter=1000, rs=117):
     # Initialize median arrays
     median_a = np.zeros(bs_iter)
     median_b = np.zeros(bs_iter)
-    # If this loop is still too slow, we could get rid of it and
-    # do everything with arrays. Depends on whether we will
-    # eventually run into memory problems with array sizes
-    # of y*bs_iter and yR*bs_iter.
     lena = len(a)
     lenb = len(b)
-    for q in range(bs_iter):
-        # Compute random indices and draw from a, b
-        draw_a_idx = prng_object.randint(0, lena, lena)
-        median_a[q] = np.median(a[draw_a_idx])
-        draw_b_idx = prng_object.randint(0, lenb, lenb)
-        median_b[q] = np.median(b[draw_b_idx])
+    # Compute the medians for several iterations at once. The number
+    # of iterations per chunk is chosen such that the drawn data do
+    # not exceed 2**20 values per array (8MB for float64).
+    chunk = max(1, 2**20 // max(lena, lenb, 1))
+    for start in range(0, bs_iter, chunk):
+        stop = min(start + chunk, bs_iter)
+        draw_a_idx = np.empty((stop - start, lena), dtype=int)
+        draw_b_idx = np.empty((stop - start, lenb), dtype=int)
+        for jj in range(stop - start):
+            # Compute random indices for a and b (the random numbers
+            # must be drawn interleaved to retain reproducibility)
+            draw_a_idx[jj] = prng_object.randint(0, lena, lena)
+            draw_b_idx[jj] = prng_object.randint(0, lenb, lenb)
+        # Draw from a, b (the drawn data are copies, so np.median may
+        # partition them in-place instead of copying them again)
+        median_a[start:stop] = np.median(a[draw_a_idx], axis=1,
+                                         overwrite_input=True)
+        median_b[start:stop] = np.median(b[draw_b_idx], axis=1,
+                                         overwrite_input=True)
     return median_a, median_b
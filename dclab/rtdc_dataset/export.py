@@ -208,8 +208,8 @@ class Export(object):
         else:
             filtarr = np.ones(len(self.rtdc_ds), dtype=bool)
 
-        # check that all features have same length and use smallest
-        # common length
+        # check that all features have the length of the dataset and
+        # use smallest common length
         lengths = []
         for feat in features:
             if feat == "trace":
@@ -217,17 +217,16 @@ class Export(object):
                     lengths.append(len(self.rtdc_ds["trace"][tr]))
             else:
                 lengths.append(len(self.rtdc_ds[feat]))
-        if not np.all(lengths == lengths[0]):
-            lmin = np.min(lengths)
-            lmax = np.max(lengths)
+        lmin = min(lengths)
+        if lmin < filtarr.size:
             nev_bef = np.sum(filtarr)
             filtarr[lmin:] = False
             nev_aft = np.sum(filtarr)
             if nev_bef != nev_aft:
                 warnings.warn(
-                    "Not all features have the same length! "
+                    "Not all features have the length of the dataset! "
                     + "Limiting output event count to {} ".format(lmin)
-                    + "(max {}) in '{}'.".format(lmax, path),
+                    + "(max {}) in '{}'.".format(filtarr.size, path),
                     LimitingExportSizeWarning)
 
         # write meta data
@@ -349,23 +348,25 @@ def hdf5_append(h5obj, rtdc_ds, feat, compression, filtarr=None,
     # - tdms-based datasets don't allow indexing with numpy
     # - there might be memory issues
     if feat == "contour":
+        contour = rtdc_ds["contour"]
         cont_list = []
         for ii in range(len(rtdc_ds)):
             if filtarr[ii]:
-                cont_list.append(rtdc_ds["contour"][ii])
+                cont_list.append(contour[ii])
         write(h5obj,
               data={"contour": cont_list},
               mode="append",
               compression=compression)
     elif feat in ["mask", "image", "image_bg"]:
         # store image stacks (reduces file size, memory usage, and saves time)
-        im0 = rtdc_ds[feat][0]
+        image = rtdc_ds[feat]
+        im0 = image[0]
         imstack = np.zeros((CHUNK_SIZE, im0.shape[0], im0.shape[1]),
                            dtype=im0.dtype)
         jj = 0
         for ii in range(len(rtdc_ds)):
             if filtarr[ii]:
-                imstack[jj] = rtdc_ds[feat][ii]
+                imstack[jj] = image[ii]
                 if (jj + 1) % CHUNK_SIZE == 0:
                     jj = 0
                     write(h5obj,
@@ -382,13 +383,15 @@ def hdf5_append(h5obj, rtdc_ds, feat, compression, filtarr=None,
                   compression=compression)
     elif feat == "trace":
         # store trace stacks (reduces file size, memory usage, and saves time)
-        for tr in rtdc_ds["trace"].keys():
-            tr0 = rtdc_ds["trace"][tr][0]
+        traces = rtdc_ds["trace"]
+        for tr in traces.keys():
+            trace = traces[tr]
+            tr0 = trace[0]
             trstack = np.zeros((CHUNK_SIZE, len(tr0)), dtype=tr0.dtype)
             jj = 0
             for ii in range(len(rtdc_ds)):
                 if filtarr[ii]:
-                    trstack[jj] = rtdc_ds["trace"][tr][ii]
+                    trstack[jj] = trace[ii]
                     if (jj + 1) % CHUNK_SIZE == 0:
                         jj = 0
                         write(h5obj,
@@ -440,8 +443,11 @@ def hdf5_append(h5obj, rtdc_ds, feat, compression, filtarr=None,
               mode="append",
               compression=compression)
     else:
+        data = rtdc_ds[feat]
+        # `filtarr` may be longer than features that are shorter than
+        # the dataset (those events are filtered out anyway)
         write(h5obj,
-              data={feat: rtdc_ds[feat][filtarr]},
+              data={feat: data[filtarr[:len(data)]]},
               mode="append",
               compression=compression)
 
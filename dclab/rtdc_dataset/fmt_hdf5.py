@@ -62,7 +62,11 @@ class H5Events(object):
             self._features.remove("trace")
 
     def __contains__(self, key):
-        return key in self.keys()
+        # Only check `key` instead of validating all stored features
+        # via `self.keys()`; unknown keys are skipped right away.
+        return (key in self._features
+                and dfn.feature_exists(key)
+                and not self._is_defective_feature(key))
 
     def __getitem__(self, key):
         # user-level checking is done in core.py
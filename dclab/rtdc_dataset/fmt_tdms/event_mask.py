@@ -17,7 +17,13 @@ class MaskColumn(object):
         mask = np.zeros(self._img_shape, dtype=bool)
         conti = self.contour[idx]
         mask[conti[:, 1], conti[:, 0]] = True
-        ndi.morphology.binary_fill_holes(mask, output=mask)
+        # Only fill holes within the bounding box of the contour (the
+        # region outside the contour is always connected to the border
+        # of the bounding box, so the result is the same).
+        xmin, ymin = np.min(conti, axis=0)
+        xmax, ymax = np.max(conti, axis=0)
+        roi = (slice(ymin, ymax + 1), slice(xmin, xmax + 1))
+        mask[roi] = ndi.morphology.binary_fill_holes(mask[roi])
         return mask
 
     def __len__(self):
@@ -12,6 +12,9 @@ from .._version import version
 #: Chunk size for storing HDF5 data
 CHUNK_SIZE = 100
 
+#: Variable-length string dtype for storing logs
+LOG_DTYPE = h5py.special_dtype(vlen=str)
+
 
 def store_contour(h5group, data, compression):
     if not isinstance(data, (list, tuple)):
@@ -77,8 +80,10 @@ def store_image(h5group, data, compression, background=False):
 def store_mask(h5group, data, compression):
     # store binary mask data as uint8 to allow visualization in HDFView
     data = np.asarray(data, dtype=np.uint8)
-    if data.max() != 255 and data.max() != 0 and data.min() == 0:
-        data = data / data.max() * 255
+    # compute the extrema of the in-memory data only once
+    dmax = data.max()
+    if dmax != 255 and dmax != 0 and data.min() == 0:
+        data = data / dmax * 255
     if len(data.shape) == 2:
         # single event
         data = data.reshape(1, data.shape[0], data.shape[1])
@@ -250,13 +255,18 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
                 msg = "Meta key not defined in dclab: {}:{}".format(sec, ck)
                 raise ValueError(msg)
 
-    # Check feature keys
+    # Check feature keys (and remember which features are scalar,
+    # so that we do not have to look it up again when storing them)
     feat_keys = []
+    feat_scalar = {}
     for kk in data:
-        if dfn.feature_exists(kk):
-            feat_keys.append(kk)
+        if dfn.scalar_feature_exists(kk):
+            feat_scalar[kk] = True
+        elif dfn.feature_exists(kk):
+            feat_scalar[kk] = False
         else:
             raise ValueError("Unknown key '{}'!".format(kk))
+        feat_keys.append(kk)
         # verify trace names
         if kk == "trace":
             for sk in data["trace"]:
@@ -311,7 +321,7 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
                 del events[rk]
     # store experimental data
     for fk in feat_keys:
-        if dfn.scalar_feature_exists(fk):
+        if feat_scalar[fk]:
             store_scalar(h5group=events,
                          name=fk,
                          data=data[fk],
@@ -347,7 +357,6 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
             for rl in logs:
                 if rl in log_group:
                     del log_group[rl]
-        dt = h5py.special_dtype(vlen=str)
         for lkey in logs:
             ldata = logs[lkey]
             if isinstance(ldata, str):
@@ -357,7 +366,7 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
             if lkey not in log_group:
                 log_dset = log_group.create_dataset(lkey,
                                                     (lnum,),
-                                                    dtype=dt,
+                                                    dtype=LOG_DTYPE,
                                                     maxshape=(None,),
                                                     chunks=True,
                                                     fletcher32=True,
@@ -126,6 +126,24 @@ def test_hdf5():
     assert np.allclose(ds2["fl3_width"], ds1["fl3_width"])
 
 
+def test_hdf5_feature_shorter_than_dataset():
+    """Exported features that are all shorter than the dataset"""
+    ddict = example_data_dict(size=127, keys=["area_um", "deform"])
+    # `len(ds)` is determined by "area_um"
+    ddict["deform"] = ddict["deform"][:100]
+    ds1 = dclab.new_dataset(ddict)
+    assert len(ds1) == 127
+
+    edest = tempfile.mkdtemp()
+    f1 = join(edest, "dclab_test_export_hdf5_shorter.rtdc")
+    with pytest.warns(dclab.rtdc_dataset.export.LimitingExportSizeWarning):
+        ds1.export.hdf5(f1, ["deform"], filtered=False)
+
+    ds2 = dclab.new_dataset(f1)
+    assert len(ds2) == 100
+    assert np.allclose(ds2["deform"], ddict["deform"])
+
+
 def test_hdf5_contour_image_trace():
     n = 65
     keys = ["contour", "image", "trace"]
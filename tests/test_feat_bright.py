@@ -1,5 +1,6 @@
 import h5py
 import numpy as np
+import pytest
 
 import dclab
 from dclab import new_dataset
@@ -57,6 +58,25 @@ def test_af_brightness_called_once(monkeypatch):
     assert wrap_get_bright.calls == 1
 
 
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")  # empty mask
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, float])
+def test_bright_dtypes(dtype):
+    """uint8 (histogram) and other dtypes (float) must give same results"""
+    rs = np.random.RandomState(42)
+    image = rs.randint(0, 256, size=(3, 40, 50)).astype(dtype)
+    mask = np.zeros((3, 40, 50), dtype=bool)
+    mask[0, 10:20, 5:30] = True
+    mask[1, 3:35, 20:45] = True
+    # the third event has an empty mask
+    avg, std = get_bright(mask=mask, image=image, ret_data="avg,sd")
+    for ii in range(2):
+        pixels = image[ii][mask[ii]]
+        assert np.allclose(avg[ii], np.mean(pixels))
+        assert np.allclose(std[ii], np.std(pixels))
+    assert np.isnan(avg[2])
+    assert np.isnan(std[2])
+
+
 def test_simple_bright():
     ds = new_dataset(retrieve_data("rtdc_data_traces_video_bright.zip"))
     for ii in range(2, 7):
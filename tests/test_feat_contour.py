@@ -7,7 +7,9 @@ import pytest
 
 import dclab
 from dclab import new_dataset
-from dclab.features.contour import get_contour, get_contour_lazily
+from dclab.features.contour import (
+    get_contour, get_contour_lazily, remove_duplicates,
+    NoValidContourFoundError)
 from dclab.features.volume import get_volume
 
 from helper_methods import retrieve_data
@@ -46,6 +48,12 @@ def test_artefact():
     assert len(cont) == 37, "just to be sure there really is something"
 
 
+def test_empty_mask():
+    mask = np.zeros((10, 10), dtype=bool)
+    with pytest.raises(NoValidContourFoundError):
+        get_contour(mask)
+
+
 def test_lazy_contour_basic():
     ds = new_dataset(retrieve_data("rtdc_data_hdf5_mask_contour.zip"))
     masks = ds["mask"][:]
@@ -78,6 +86,11 @@ def test_lazy_contour_type():
     assert isinstance(c2, dclab.features.contour.LazyContourList)
 
 
+def test_remove_duplicates():
+    cont = np.array([[1, 2], [1, 2], [2, 2], [3, 3], [3, 3], [1, 2]])
+    assert np.all(remove_duplicates(cont) == [[2, 2], [3, 3], [1, 2]])
+
+
 def test_simple_contour():
     ds = new_dataset(retrieve_data("rtdc_data_traces_video_bright.zip"))
     # Note: contour "3" in ds is bad!
@@ -5,6 +5,7 @@ An ellipse is created and the analytical and numerical solution are compared
 import itertools as IT
 
 import numpy as np
+import pytest
 
 import dclab
 from dclab.features.volume import get_volume
@@ -129,6 +130,49 @@ def test_get_volume():
     assert np.allclose(np.array(volume), np.array(V)), msg
 
 
+def test_get_volume_out():
+    ellip = get_ellipse_coords(a=10,
+                               b=5,
+                               x=5,
+                               y=5,
+                               angle=0,
+                               k=100)
+    cx, cy = centroid_of_polygon(ellip)
+    out = np.zeros(2, dtype=float)
+    volume = get_volume(cont=[ellip, ellip[:3]],
+                        pos_x=[cx, cx],
+                        pos_y=[cy, cy],
+                        pix=1,
+                        out=out)
+    assert volume is out
+    assert np.allclose(out[0], get_volume(cont=ellip, pos_x=cx, pos_y=cy,
+                                          pix=1))
+    # contours with less than 4 points yield nan
+    assert np.isnan(out[1])
+
+
+def test_get_volume_out_invalid():
+    ellip = get_ellipse_coords(a=10,
+                               b=5,
+                               x=5,
+                               y=5,
+                               angle=0,
+                               k=100)
+    cx, cy = centroid_of_polygon(ellip)
+    # scalar input
+    with pytest.raises(ValueError, match="scalar"):
+        get_volume(cont=ellip, pos_x=cx, pos_y=cy, pix=1,
+                   out=np.zeros(1, dtype=float))
+    # wrong shape
+    with pytest.raises(ValueError, match="Shape"):
+        get_volume(cont=[ellip, ellip], pos_x=[cx, cx], pos_y=[cy, cy],
+                   pix=1, out=np.zeros(3, dtype=float))
+    # wrong dtype
+    with pytest.raises(ValueError, match="floating point"):
+        get_volume(cont=[ellip, ellip], pos_x=[cx, cx], pos_y=[cy, cy],
+                   pix=1, out=np.zeros(2, dtype=int))
+
+
 def test_shape():
     major = 10
     minor = 5